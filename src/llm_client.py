@@ -1,8 +1,10 @@
 import logging
 import os
+import threading
 from enum import Enum
+from functools import lru_cache
 from time import perf_counter
-from typing import List
+from typing import Any, List, Optional, Tuple
 
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 from langchain_core.messages import BaseMessage
@@ -16,6 +18,20 @@ from .types import ChatMessageDict, LLMReviewResult
 
 logger = logging.getLogger(__name__)
 
+# LLM 클라이언트 생성에 영향을 주는 환경 변수 목록.
+# 값이 바뀌면 캐시 키가 달라져 새 클라이언트를 생성한다.
+_LLM_CLIENT_ENV_NAMES = (
+    "LLM_TIMEOUT_SECONDS",
+    "LLM_MAX_RETRIES",
+    "OPENAI_API_KEY",
+    "GOOGLE_API_KEY",
+    "OLLAMA_BASE_URL",
+    "OPENROUTER_API_KEY",
+    "OPENROUTER_BASE_URL",
+)
+
+_llm_cache_lock = threading.Lock()
+
 
 class LLMProvider(str, Enum):
     OPENAI = "openai"
@@ -75,6 +91,12 @@ def _get_llm_max_retries() -> int:
         return 0
 
 
+@lru_cache(maxsize=8)
+def _get_system_message(content: str) -> SystemMessage:
+    # system 프롬프트는 리뷰마다 동일하므로 변환된 메시지 객체를 재사용한다.
+    return SystemMessage(content=content)
+
+
 def _to_langchain_messages(messages: List[ChatMessageDict]) -> List[BaseMessage]:
     lc_messages: List[BaseMessage] = []
     for message in messages:
@@ -82,7 +104,7 @@ def _to_langchain_messages(messages: List[ChatMessageDict]) -> List[BaseMessage]
         content = message.get("content", "")
 
         if role == "system":
-            lc_messages.append(SystemMessage(content=content))
+            lc_messages.append(_get_system_message(content))
         elif role == "user":
             lc_messages.append(HumanMessage(content=content))
         elif role == "assistant":
@@ -116,6 +138,8 @@ def _create_openai_llm(model: str, temperature: float) -> ChatOpenAI:
         temperature=temperature,
         timeout=timeout,
         max_retries=max_retries,
+        # 스트리밍 응답에서도 마지막 청크에 토큰 사용량을 포함하도록 요청한다.
+        stream_usage=True,
     )
 
 
@@ -170,6 +194,8 @@ def _create_openrouter_llm(model: str, temperature: float) -> ChatOpenAI:
         timeout=timeout,
         base_url=base_url,
         max_retries=max_retries,
+        # base_url을 지정하면 ChatOpenAI가 stream_usage를 켜지 않으므로 명시한다.
+        stream_usage=True,
     )
 
 
@@ -191,23 +217,102 @@ def _create_llm(model: str, temperature: float) -> BaseChatModel:
     raise ValueError(f"Unsupported LLM provider: {provider}")
 
 
+@lru_cache(maxsize=4)
+def _get_cached_llm(
+    provider: LLMProvider,
+    model: str,
+    temperature: float,
+    env_snapshot: Tuple[Optional[str], ...],
+) -> BaseChatModel:
+    # provider/env_snapshot는 캐시 키로만 사용한다.
+    return _create_llm(model=model, temperature=temperature)
+
+
+def _get_llm(model: str, temperature: float) -> BaseChatModel:
+    """동일한 설정에 대해서는 LLM 클라이언트를 재사용한다.
+
+    클라이언트마다 내부 HTTP 커넥션 풀을 가지므로, 매 리뷰마다 새로 생성하면
+    TCP/TLS 연결을 다시 맺어야 한다. 설정이 같으면 캐시된 인스턴스를 반환해
+    keep-alive 연결을 재사용한다.
+    """
+
+    provider = _get_llm_provider()
+    env_snapshot = tuple(os.environ.get(name) for name in _LLM_CLIENT_ENV_NAMES)
+    with _llm_cache_lock:
+        return _get_cached_llm(provider, model, temperature, env_snapshot)
+
+
+def _content_to_text(content: Any) -> str:
+    """LangChain 메시지 content를 문자열로 변환한다.
+
+    provider/응답 종류에 따라 content가 None이거나 content block 리스트일 수 있다.
+    """
+
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts: List[str] = []
+        for block in content:
+            if isinstance(block, str):
+                parts.append(block)
+            elif isinstance(block, dict) and block.get("type") == "text":
+                parts.append(block.get("text") or "")
+        return "".join(parts)
+    return str(content)
+
+
+def _stream_response(
+    llm: BaseChatModel,
+    lc_messages: List[BaseMessage],
+) -> Tuple[str, Optional[BaseMessage]]:
+    """스트리밍으로 LLM을 호출해 텍스트와 토큰 사용량 추출용 청크를 반환한다.
+
+    청크 텍스트는 리스트에 모아 마지막에 한 번만 합친다.
+    토큰 사용량은 보통 마지막 청크에만 포함되므로,
+    usage_metadata가 있는 청크를 우선 사용한다.
+    """
+
+    parts: List[str] = []
+    last_chunk: Optional[BaseMessage] = None
+    usage_chunk: Optional[BaseMessage] = None
+
+    for chunk in llm.stream(lc_messages):
+        parts.append(_content_to_text(chunk.content))
+        last_chunk = chunk
+        if isinstance(getattr(chunk, "usage_metadata", None), dict):
+            usage_chunk = chunk
+
+    return "".join(parts), usage_chunk or last_chunk
+
+
 def generate_review_content_with_stats(
     messages: List[ChatMessageDict],
+    stream: bool = False,
 ) -> LLMReviewResult:
-    """주어진 messages를 기반으로 LLM을 호출하고, 결과와 메타데이터를 함께 반환한다."""
+    """주어진 messages를 기반으로 LLM을 호출하고, 결과와 메타데이터를 함께 반환한다.
+
+    stream=True이면 응답을 스트리밍으로 받아 청크 단위로 누적한다.
+    """
 
     lc_messages = _to_langchain_messages(messages)
 
     # temperature는 리뷰 결과의 일관성을 위해 1.0으로 고정한다.
     model = _get_llm_model()
     provider = _get_llm_provider()
-    llm = _create_llm(model=model, temperature=1.0)
+    llm = _get_llm(model=model, temperature=1.0)
 
     started_at = perf_counter()
-    response = llm.invoke(lc_messages)
+    response: Optional[BaseMessage]
+    if stream:
+        text, response = _stream_response(llm, lc_messages)
+    else:
+        response = llm.invoke(lc_messages)
+        text = _content_to_text(response.content)
     elapsed = perf_counter() - started_at
 
-    content = response.content.strip()
+    content = text.strip()
 
     result: LLMReviewResult = {
         "content": content,
@@ -253,10 +358,11 @@ def generate_review_content_with_stats(
 
 def generate_review_content(
     messages: List[ChatMessageDict],
+    stream: bool = False,
 ) -> str:
     """기존 API를 유지하기 위한 래퍼. 리뷰 텍스트 문자열만 반환한다."""
 
-    result = generate_review_content_with_stats(messages)
+    result = generate_review_content_with_stats(messages, stream=stream)
     return result["content"]
 
 
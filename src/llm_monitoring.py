@@ -1,9 +1,14 @@
+import atexit
 import logging
 import os
+import queue
+import threading
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .types import LLMReviewResult
 
@@ -11,17 +16,132 @@ from .types import LLMReviewResult
 logger = logging.getLogger(__name__)
 
 
-def _get_webhook_url() -> str | None:
+def _create_session() -> requests.Session:
+    """웹훅 전송에 재사용할 keep-alive 세션을 생성한다."""
+
+    retry = Retry(
+        total=2,
+        # 요청이 이미 전달된 뒤 응답을 기다리다 타임아웃된 경우에는 재전송하지 않는다.
+        # (같은 이벤트가 중복 전송되어 모니터링 집계가 부풀려지는 것을 막는다.)
+        read=0,
+        backoff_factor=0.1,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(["POST"]),
+        # 재시도 후에도 실패하면 예외 대신 마지막 응답을 돌려받아 status_code로 처리한다.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = _create_session()
+atexit.register(_session.close)
+
+# 웹훅 전송은 best-effort 이므로 리뷰 처리 경로를 막지 않도록 백그라운드 스레드에서 처리한다.
+_SEND_QUEUE_MAX_SIZE = 256
+
+WebhookTask = Tuple[str, Dict[str, Any], float]
+
+_send_queue: "queue.Queue[WebhookTask]" = queue.Queue(maxsize=_SEND_QUEUE_MAX_SIZE)
+_sender_lock = threading.Lock()
+_sender_started = False
+
+
+_SOURCE = "gitlab-ai-code-reviewer"
+# 큰 응답 본문을 감싼 예외의 경우 str/repr 결과가 매우 커질 수 있어 길이를 제한한다.
+_ERROR_TEXT_MAX_LENGTH = 4096
+_DEFAULT_TIMEOUT_SECONDS = 3.0
+
+
+def _read_webhook_url() -> str | None:
     url = os.environ.get("LLM_MONITORING_WEBHOOK_URL")
     if not url or not url.strip():
         return None
     return url.strip()
 
 
+def _read_timeout_seconds() -> float:
+    raw_value = os.environ.get("LLM_MONITORING_TIMEOUT_SECONDS")
+    if raw_value is None or not raw_value.strip():
+        return _DEFAULT_TIMEOUT_SECONDS
+
+    try:
+        seconds = float(raw_value)
+        if seconds <= 0:
+            raise ValueError
+        return seconds
+    except ValueError:
+        logger.warning(
+            "Invalid LLM_MONITORING_TIMEOUT_SECONDS '%s', using default %ss",
+            raw_value,
+            _DEFAULT_TIMEOUT_SECONDS,
+        )
+        return _DEFAULT_TIMEOUT_SECONDS
+
+
+# 웹훅 설정은 실행 중에 바뀌지 않으므로 모듈 로드 시 한 번만 읽는다.
+_webhook_url: str | None = None
+_timeout_seconds: float = _DEFAULT_TIMEOUT_SECONDS
+
+
+def _refresh_env() -> None:
+    """환경 변수에서 웹훅 설정을 다시 읽는다. (테스트 등에서 env 변경 후 호출)"""
+
+    global _webhook_url, _timeout_seconds
+
+    _webhook_url = _read_webhook_url()
+    _timeout_seconds = _read_timeout_seconds()
+
+
+_refresh_env()
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _build_payload(
+    *,
+    status: str,
+    event: str,
+    gitlab: Dict[str, Any],
+    llm: Dict[str, Any],
+    extra: Dict[str, Any],
+) -> Dict[str, Any]:
+    """공통 필드에 이벤트별 섹션(review/error)을 더해 웹훅 payload를 만든다."""
+
+    return {
+        "status": status,
+        "event": event,
+        "source": _SOURCE,
+        "timestamp": _now_iso(),
+        "gitlab": gitlab,
+        "llm": llm,
+        **extra,
+    }
+
+
+def _build_review_section(result: LLMReviewResult) -> Dict[str, Any]:
+    content = (result.get("content") or "").strip()
+    return {
+        "content": content,
+        "length": len(content),
+    }
+
+
+def _build_error_section(error: Exception) -> Dict[str, Any]:
+    # 전송 큐에는 예외 객체 대신 문자열만 넣어, 예외가 참조하는 프레임이 큐에 남지 않게 한다.
+    return {
+        "type": type(error).__name__,
+        "message": str(error)[:_ERROR_TEXT_MAX_LENGTH],
+        "detail": repr(error)[:_ERROR_TEXT_MAX_LENGTH],
+    }
+
+
 def _build_llm_section_from_result(result: LLMReviewResult) -> Dict[str, Any]:
     return {
         "provider": result.get("provider"),
@@ -33,15 +153,9 @@ def _build_llm_section_from_result(result: LLMReviewResult) -> Dict[str, Any]:
     }
 
 
-def _post_payload(payload: Dict[str, Any]) -> None:
-    url = _get_webhook_url()
-    if url is None:
-        return
-
-    timeout = float(os.environ.get("LLM_MONITORING_TIMEOUT_SECONDS", "3"))
-
+def _send(url: str, payload: Dict[str, Any], timeout: float) -> None:
     try:
-        response = requests.post(url, json=payload, timeout=timeout)
+        response = _session.post(url, json=payload, timeout=timeout)
         if response.status_code >= 400:
             logger.warning(
                 "LLM monitoring webhook returned status_code=%s",
@@ -53,6 +167,51 @@ def _post_payload(payload: Dict[str, Any]) -> None:
         logger.exception("Failed to send LLM monitoring webhook")
 
 
+def _sender_loop() -> None:
+    while True:
+        url, payload, timeout = _send_queue.get()
+        try:
+            _send(url, payload, timeout)
+        finally:
+            _send_queue.task_done()
+
+
+def _ensure_sender_started() -> None:
+    """웹훅 전송 스레드를 최초 한 번만 생성한다."""
+
+    global _sender_started
+
+    if _sender_started:
+        return
+
+    with _sender_lock:
+        if _sender_started:
+            return
+
+        sender = threading.Thread(
+            target=_sender_loop,
+            name="llm-monitoring-sender",
+            daemon=True,
+        )
+        sender.start()
+        _sender_started = True
+
+
+def _post_payload(payload: Dict[str, Any]) -> None:
+    url = _webhook_url
+    if url is None:
+        return
+
+    _ensure_sender_started()
+    try:
+        _send_queue.put_nowait((url, payload, _timeout_seconds))
+    except queue.Full:
+        logger.warning(
+            "LLM monitoring webhook queue is full (size=%s); dropping event",
+            _SEND_QUEUE_MAX_SIZE,
+        )
+
+
 def send_merge_request_llm_success(
     *,
     gitlab_api_base_url: str,
@@ -62,27 +221,20 @@ def send_merge_request_llm_success(
 ) -> None:
     """머지 요청 리뷰 성공 시 LLM 결과를 모니터링 웹훅으로 전송한다."""
 
-    if _get_webhook_url() is None:
+    if _webhook_url is None:
         return
 
-    content = (llm_result.get("content") or "").strip()
-    payload: Dict[str, Any] = {
-        "status": "success",
-        "event": "merge_request_review",
-        "source": "gitlab-ai-code-reviewer",
-        "timestamp": _now_iso(),
-        "gitlab": {
+    payload = _build_payload(
+        status="success",
+        event="merge_request_review",
+        gitlab={
             "api_base_url": gitlab_api_base_url,
             "project_id": project_id,
             "merge_request_iid": merge_request_iid,
         },
-        "llm": _build_llm_section_from_result(llm_result),
-        "review": {
-            "content": content,
-            "length": len(content),
-        },
-    }
-
+        llm=_build_llm_section_from_result(llm_result),
+        extra={"review": _build_review_section(llm_result)},
+    )
     _post_payload(payload)
 
 
@@ -95,27 +247,20 @@ def send_push_llm_success(
 ) -> None:
     """푸시(커밋) 리뷰 성공 시 LLM 결과를 모니터링 웹훅으로 전송한다."""
 
-    if _get_webhook_url() is None:
+    if _webhook_url is None:
         return
 
-    content = (llm_result.get("content") or "").strip()
-    payload: Dict[str, Any] = {
-        "status": "success",
-        "event": "push_review",
-        "source": "gitlab-ai-code-reviewer",
-        "timestamp": _now_iso(),
-        "gitlab": {
+    payload = _build_payload(
+        status="success",
+        event="push_review",
+        gitlab={
             "api_base_url": gitlab_api_base_url,
             "project_id": project_id,
             "commit_id": commit_id,
         },
-        "llm": _build_llm_section_from_result(llm_result),
-        "review": {
-            "content": content,
-            "length": len(content),
-        },
-    }
-
+        llm=_build_llm_section_from_result(llm_result),
+        extra={"review": _build_review_section(llm_result)},
+    )
     _post_payload(payload)
 
 
@@ -130,30 +275,20 @@ def send_merge_request_llm_error(
 ) -> None:
     """머지 요청 리뷰 중 LLM 또는 관련 처리 에러가 발생했을 때 웹훅으로 전송한다."""
 
-    if _get_webhook_url() is None:
+    if _webhook_url is None:
         return
 
-    payload: Dict[str, Any] = {
-        "status": "error",
-        "event": "merge_request_review",
-        "source": "gitlab-ai-code-reviewer",
-        "timestamp": _now_iso(),
-        "gitlab": {
+    payload = _build_payload(
+        status="error",
+        event="merge_request_review",
+        gitlab={
             "api_base_url": gitlab_api_base_url,
             "project_id": project_id,
             "merge_request_iid": merge_request_iid,
         },
-        "llm": {
-            "provider": provider,
-            "model": model,
-        },
-        "error": {
-            "type": type(error).__name__,
-            "message": str(error),
-            "detail": repr(error),
-        },
-    }
-
+        llm={"provider": provider, "model": model},
+        extra={"error": _build_error_section(error)},
+    )
     _post_payload(payload)
 
 
@@ -168,28 +303,18 @@ def send_push_llm_error(
 ) -> None:
     """푸시(커밋) 리뷰 중 LLM 또는 관련 처리 에러가 발생했을 때 웹훅으로 전송한다."""
 
-    if _get_webhook_url() is None:
+    if _webhook_url is None:
         return
 
-    payload: Dict[str, Any] = {
-        "status": "error",
-        "event": "push_review",
-        "source": "gitlab-ai-code-reviewer",
-        "timestamp": _now_iso(),
-        "gitlab": {
+    payload = _build_payload(
+        status="error",
+        event="push_review",
+        gitlab={
             "api_base_url": gitlab_api_base_url,
             "project_id": project_id,
             "commit_id": commit_id,
         },
-        "llm": {
-            "provider": provider,
-            "model": model,
-        },
-        "error": {
-            "type": type(error).__name__,
-            "message": str(error),
-            "detail": repr(error),
-        },
-    }
-
+        llm={"provider": provider, "model": model},
+        extra={"error": _build_error_section(error)},
+    )
     _post_payload(payload)
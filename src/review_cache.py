@@ -3,16 +3,46 @@ import json
 import logging
 import os
 import sqlite3
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 직렬화한다.
+    orjson = None  # type: ignore[assignment]
 
 from .types import GitDiffChange, LLMReviewResult
 
 
 logger = logging.getLogger(__name__)
 
+CacheEntry = Tuple[str, str, List[GitDiffChange], LLMReviewResult]
+MemoryCacheKey = Tuple[str, str, str]
+
 _DEFAULT_DB_PATH = "data/review_cache.db"
 _DB_ENV_NAME = "REVIEW_CACHE_DB_PATH"
 
+# 캐시 키 계산 방식이나 테이블 구조가 바뀌면 올린다.
+# 1: WITHOUT ROWID 테이블, result_json은 UTF-8 JSON bytes(BLOB),
+#    diff_hash는 전체 diff를 하나의 스트림으로 직렬화한 SHA-256 hex
+_SCHEMA_VERSION = 1
+
+# 재시도 등으로 같은 키를 반복 조회할 때 SQLite까지 가지 않도록 프로세스 메모리에 보관한다.
+# 다른 프로세스가 쓴 결과를 너무 오래 놓치지 않도록 miss는 더 짧게 유지한다.
+_MEMORY_CACHE_MAX_SIZE = 1024
+_MEMORY_CACHE_HIT_TTL_SECONDS = 60.0
+_MEMORY_CACHE_MISS_TTL_SECONDS = 5.0
+
+# 만료 시각 계산에 쓰는 시계. 테스트에서는 전역 time.monotonic 대신 이 값을 바꾼다.
+_monotonic = time.monotonic
+
+MemoryCacheEntry = Tuple[float, Optional[LLMReviewResult]]
+
+_memory_cache: "OrderedDict[MemoryCacheKey, MemoryCacheEntry]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
 
 def _get_db_path() -> str:
     value = os.environ.get(_DB_ENV_NAME)
@@ -21,30 +51,199 @@ def _get_db_path() -> str:
     return _DEFAULT_DB_PATH
 
 
-def _get_connection() -> sqlite3.Connection:
-    path = _get_db_path()
+# 스레드마다 하나의 커넥션을 열어 재사용한다.
+_local = threading.local()
+_schema_lock = threading.Lock()
+_initialized_paths: Set[str] = set()
+
+# 커넥션마다 적용해야 하는 PRAGMA 설정.
+# journal_mode=WAL 은 DB 파일에 영구 저장되므로 스키마 초기화 시 한 번만 설정한다.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
 
+def _initialize_schema(conn: sqlite3.Connection, path: str) -> None:
+    """DB 파일별로 최초 한 번만 WAL 모드를 켜고 스키마를 생성한다.
+
+    저장된 스키마 버전(PRAGMA user_version)이 현재 버전과 다르면,
+    캐시 키 형식이나 테이블 구조가 달라 재사용할 수 없으므로
+    기존 테이블을 버리고 새로 만든다.
+    테이블은 조회 키인 PK 인덱스에 행 데이터를 함께 저장하도록 WITHOUT ROWID로 만든다.
+    """
+
+    with _schema_lock:
+        if path in _initialized_paths:
+            return
+
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS review_cache")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS review_cache (
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    diff_hash TEXT NOT NULL,
+                    result_json BLOB NOT NULL,
+                    PRIMARY KEY (provider, model, diff_hash)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        _initialized_paths.add(path)
+
+
+def _open_connection(path: str) -> sqlite3.Connection:
     # DB 파일이 위치할 디렉터리가 없으면 생성한다.
     directory = os.path.dirname(path)
     if directory:
         os.makedirs(directory, exist_ok=True)
 
-    conn = sqlite3.connect(path)
-    # 스키마가 없으면 생성한다.
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS review_cache (
-            provider TEXT NOT NULL,
-            model TEXT NOT NULL,
-            diff_hash TEXT NOT NULL,
-            result_json TEXT NOT NULL,
-            PRIMARY KEY (provider, model, diff_hash)
-        )
-        """
-    )
+    # isolation_level=None: 단건 쓰기는 autocommit으로 처리한다.
+    conn = sqlite3.connect(path, isolation_level=None)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    _initialize_schema(conn, path)
     return conn
 
 
+# 조회/저장 SQL. sqlite3 모듈의 커넥션별 statement 캐시에서 재사용된다.
+_SQL_GET = (
+    "SELECT result_json FROM review_cache"
+    " WHERE provider = ? AND model = ? AND diff_hash = ?"
+)
+_SQL_PUT = """
+    INSERT INTO review_cache (provider, model, diff_hash, result_json)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(provider, model, diff_hash) DO UPDATE SET
+        result_json = excluded.result_json
+"""
+
+
+def _get_connection() -> sqlite3.Connection:
+    """현재 스레드에서 재사용할 커넥션을 반환한다.
+
+    DB 경로가 바뀐 경우에는 기존 커넥션을 닫고 새로 연다.
+    """
+
+    path = _get_db_path()
+    conn: Optional[sqlite3.Connection] = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) == path:
+        return conn
+
+    _discard_connection()
+    conn = _open_connection(path)
+    _local.conn = conn
+    _local.path = path
+    _local.cursor = conn.cursor()
+    return conn
+
+
+def _get_cursor() -> sqlite3.Cursor:
+    """현재 스레드의 커넥션에 묶인 cursor를 재사용한다."""
+
+    _get_connection()
+    return _local.cursor
+
+
+def _discard_connection() -> None:
+    """현재 스레드의 커넥션을 닫는다. 오류 이후에는 다음 호출에서 다시 연다."""
+
+    conn: Optional[sqlite3.Connection] = getattr(_local, "conn", None)
+    _local.conn = None
+    _local.path = None
+    _local.cursor = None
+    if conn is None:
+        return
+
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def _memory_cache_get(
+    key: MemoryCacheKey,
+) -> Tuple[bool, Optional[LLMReviewResult]]:
+    """메모리 캐시를 조회해 (존재 여부, 결과)를 반환한다. 만료된 항목은 제거한다.
+
+    호출자가 결과를 수정해도 캐시에 영향이 없도록 복사본을 반환한다.
+    """
+
+    now = _monotonic()
+    with _memory_cache_lock:
+        entry = _memory_cache.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= now:
+            del _memory_cache[key]
+            return False, None
+
+        _memory_cache.move_to_end(key)
+        return True, (value.copy() if value is not None else None)
+
+
+def _memory_cache_put(key: MemoryCacheKey, value: Optional[LLMReviewResult]) -> None:
+    """결과(또는 miss를 뜻하는 None)를 메모리 캐시에 저장한다.
+
+    SQLite miss를 읽은 뒤 다른 스레드가 같은 키의 결과를 저장했을 수 있으므로,
+    miss는 이미 저장된 결과를 덮어쓰지 않는다.
+    """
+
+    if value is None:
+        ttl = _MEMORY_CACHE_MISS_TTL_SECONDS
+    else:
+        ttl = _MEMORY_CACHE_HIT_TTL_SECONDS
+        value = value.copy()
+
+    with _memory_cache_lock:
+        if value is None:
+            existing = _memory_cache.get(key)
+            if existing is not None and existing[1] is not None:
+                return
+
+        _memory_cache[key] = (_monotonic() + ttl, value)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > _MEMORY_CACHE_MAX_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _memory_cache_invalidate(key: MemoryCacheKey) -> None:
+    with _memory_cache_lock:
+        _memory_cache.pop(key, None)
+
+
+def _clear_memory_cache() -> None:
+    with _memory_cache_lock:
+        _memory_cache.clear()
+
+
+def _dumps(result: LLMReviewResult) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(result)
+    return json.dumps(result).encode("utf-8")
+
+
+def _loads(payload: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
 def _build_diff_hash(changes: List[GitDiffChange]) -> str:
     """주어진 diff 목록으로부터 캐시용 해시 값을 계산한다.
 
@@ -55,6 +254,8 @@ def _build_diff_hash(changes: List[GitDiffChange]) -> str:
     hasher = hashlib.sha256()
 
     for change in changes:
+        # get = change.get 처럼 지역 변수에 묶지 않는다.
+        # Python 3.11에서는 change.get(...) 직접 호출이 메서드 호출로 특수화되어 더 빠르다.
         old_path = change.get("old_path") or ""
         new_path = change.get("new_path") or ""
         flags = "".join(
@@ -87,31 +288,32 @@ def get_cached_review_for_changes(
 ) -> Optional[LLMReviewResult]:
     """provider, model, diff 목록 조합에 대한 캐시된 리뷰 결과를 반환한다.
 
+    최근에 조회/저장한 키는 메모리 캐시에서 바로 반환한다(miss 포함).
     DB 오류가 발생하면 예외를 전파하지 않고 None을 반환해 캐시를 건너뛴다.
     """
 
     diff_hash = _build_diff_hash(changes)
+    key: MemoryCacheKey = (provider, model, diff_hash)
+    found, cached = _memory_cache_get(key)
+    if found:
+        return cached
+
     try:
-        conn = _get_connection()
-        cursor = conn.execute(
-            "SELECT result_json FROM review_cache WHERE provider = ? AND model = ? AND diff_hash = ?",
-            (provider, model, diff_hash),
-        )
+        cursor = _get_cursor()
+        cursor.execute(_SQL_GET, key)
         row = cursor.fetchone()
         if not row:
+            _memory_cache_put(key, None)
             return None
 
         payload = row[0]
-        data = json.loads(payload)
-        return data  # type: ignore[return-value]
+        data: LLMReviewResult = _loads(payload)
+        _memory_cache_put(key, data)
+        return data
     except Exception:
         logger.exception("Failed to read review cache; skipping cache usage.")
+        _discard_connection()
         return None
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
 
 def put_cached_review_for_changes(
@@ -125,26 +327,47 @@ def put_cached_review_for_changes(
     DB 오류가 발생하더라도 호출자는 영향을 받지 않는다.
     """
 
-    diff_hash = _build_diff_hash(changes)
+    put_cached_reviews_for_changes_batch([(provider, model, changes, result)])
+
+
+def put_cached_reviews_for_changes_batch(
+    entries: List[CacheEntry],
+) -> None:
+    """여러 리뷰 결과를 하나의 트랜잭션으로 캐시에 저장한다.
+
+    entries의 각 항목은 (provider, model, diff 목록, 리뷰 결과) 튜플이다.
+    건별 커밋 대신 한 번만 커밋하므로 여러 건을 쓸 때 fsync 횟수가 줄어든다.
+    DB 오류가 발생하더라도 호출자는 영향을 받지 않는다.
+    """
+
+    if not entries:
+        return
+
+    keys: List[MemoryCacheKey] = []
     try:
-        conn = _get_connection()
-        payload = json.dumps(result)
-        conn.execute(
-            """
-            INSERT INTO review_cache (provider, model, diff_hash, result_json)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(provider, model, diff_hash) DO UPDATE SET
-                result_json = excluded.result_json
-            """,
-            (provider, model, diff_hash, payload),
-        )
-        conn.commit()
+        rows = []
+        for provider, model, changes, result in entries:
+            key: MemoryCacheKey = (provider, model, _build_diff_hash(changes))
+            keys.append(key)
+            rows.append((*key, _dumps(result)))
+
+        cursor = _get_cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(_SQL_PUT, rows)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
     except Exception:
         logger.exception(
             "Failed to write review cache; ignoring cache persistence error."
         )
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        _discard_connection()
+        # 저장에 실패했으므로 메모리에 남아 있을 수 있는 이전 조회 결과(miss 등)를 버린다.
+        for key in keys:
+            _memory_cache_invalidate(key)
+        return
+
+    for key, (_, _, _, result) in zip(keys, entries):
+        _memory_cache_put(key, result)
@@ -1,7 +1,8 @@
 import logging
+from functools import lru_cache
 from typing import List
 
-from langchain_core.runnables import RunnableLambda, RunnableSequence
+from langchain_core.runnables import Runnable, RunnableLambda
 
 from .review_prompt import generate_review_prompt
 from .llm_client import generate_review_content_with_stats
@@ -15,31 +16,21 @@ DiffList = List[GitDiffChange]
 MessageList = List[ChatMessageDict]
 
 
-_review_chain: RunnableSequence[DiffList, LLMReviewResult] | None = None
+def _run_review(changes: DiffList) -> LLMReviewResult:
+    # 프롬프트 생성과 LLM 호출을 하나의 단계로 묶어 단계 간 Runnable 디스패치 비용을 없앤다.
+    messages: MessageList = generate_review_prompt(changes)
+    return generate_review_content_with_stats(messages)
 
 
-def get_review_chain() -> RunnableSequence[DiffList, LLMReviewResult]:
+@lru_cache(maxsize=1)
+def get_review_chain() -> Runnable[DiffList, LLMReviewResult]:
     """diff 정보를 받아 리뷰 텍스트를 생성하는 LangChain Runnable 체인을 반환한다.
 
     입력: GitLab diff 목록 (merge request changes 혹은 commit diff)
     출력: 리뷰 텍스트 문자열
-    """
-
-    global _review_chain
-
-    if _review_chain is not None:
-        return _review_chain
 
-    prompt_step: RunnableLambda[DiffList, MessageList] = RunnableLambda(
-        generate_review_prompt,
-    )
-    llm_step: RunnableLambda[MessageList, LLMReviewResult] = RunnableLambda(
-        generate_review_content_with_stats,
-    )
-
-    chain: RunnableSequence[DiffList, LLMReviewResult] = prompt_step | llm_step
-    _review_chain = chain
-
-    logger.info("Initialized review chain RunnableSequence")
+    체인은 최초 호출 시 한 번만 구성되며, 이후에는 같은 인스턴스를 반환한다.
+    """
 
-    return chain
+    logger.info("Initialized review chain Runnable")
+    return RunnableLambda(_run_review)
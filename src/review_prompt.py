@@ -63,6 +63,9 @@ VERDICT RULE: (판정 규칙)
 - Structural(구조적 제안)
 """
 
+# user 메시지 앞에 붙는 고정 문구
+_USER_PROMPT_PREFIX = "Review the following git diffs:\n\n"
+
 
 def _get_system_instruction() -> str:
     value = os.environ.get("REVIEW_SYSTEM_PROMPT")
@@ -77,17 +80,11 @@ def format_file_header(change: GitDiffChange) -> str:
     new_path = change.get("new_path")
 
     # GitLab/GitHub API 플래그 확인 (없을 경우 경로 비교로 추론)
-    is_new = change.get("new_file", False)
-    is_deleted = change.get("deleted_file", False)
-    is_renamed = change.get("renamed_file", False) or (
-        old_path and new_path and old_path != new_path
-    )
-
-    if is_new:
+    if change.get("new_file"):
         return f"🆕 **NEW FILE**: `{new_path}`"
-    if is_deleted:
+    if change.get("deleted_file"):
         return f"🗑️ **DELETED**: `{old_path}`"
-    if is_renamed:
+    if change.get("renamed_file") or (old_path and new_path and old_path != new_path):
         return f"🚚 **RENAMED**: `{old_path}` ➡️ `{new_path}`"
 
     # 일반적인 수정 (경로 변경 없음)
@@ -101,10 +98,10 @@ def generate_review_prompt(changes: List[GitDiffChange]) -> List[ChatMessageDict
     formatted_changes: List[str] = []
     for change in changes:
         header = format_file_header(change)
-        diff_content = change.get("diff", "")
+        diff_content = change.get("diff") or ""
 
         # 내용이 없거나 바이너리 등의 경우에 대한 기본 메시지
-        if not str(diff_content).strip():
+        if not diff_content.strip():
             diff_content = "(No content changes or binary file)"
 
         formatted_changes.append(f"{header}\n```diff\n{diff_content}\n```")
@@ -119,7 +116,7 @@ def generate_review_prompt(changes: List[GitDiffChange]) -> List[ChatMessageDict
         },
         {
             "role": "user",
-            "content": f"Review the following git diffs:\n\n{changes_string}",
+            "content": _USER_PROMPT_PREFIX + changes_string,
         },
     ]
 
@@ -6,8 +6,9 @@ from src import llm_client
 
 
 class _DummyResponse:
-    def __init__(self, content: str) -> None:
+    def __init__(self, content: Any, usage_metadata: Any = None) -> None:  # noqa: ANN401
         self.content = content
+        self.usage_metadata = usage_metadata
 
 
 class _DummyChatModel:
@@ -23,6 +24,15 @@ class _DummyChatModel:
         _DummyChatModel.last_invoked_messages = messages
         return _DummyResponse("dummy-response")
 
+    def stream(self, messages: list[Any]) -> Any:  # noqa: D401, ANN401
+        _DummyChatModel.last_invoked_messages = messages
+        yield _DummyResponse(" dummy-")
+        yield _DummyResponse("streamed ")
+        yield _DummyResponse(
+            "",
+            usage_metadata={"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+        )
+
 
 def test_create_llm_openai_uses_chatopenai(
     monkeypatch: pytest.MonkeyPatch,
@@ -45,6 +55,7 @@ def test_create_llm_openai_uses_chatopenai(
     assert _DummyChatModel.last_init_kwargs["model"] == "gpt-5-mini"
     assert _DummyChatModel.last_init_kwargs["api_key"] == "test-key"
     assert "base_url" not in _DummyChatModel.last_init_kwargs
+    assert _DummyChatModel.last_init_kwargs["stream_usage"] is True
 
 
 def test_create_llm_gemini_uses_chatgoogle(
@@ -119,6 +130,7 @@ def test_create_llm_openrouter_uses_chatopenai_with_openrouter_base(
     assert (
         _DummyChatModel.last_init_kwargs["base_url"] == "https://openrouter.ai/api/v1"
     )
+    assert _DummyChatModel.last_init_kwargs["stream_usage"] is True
 
 
 def test_create_llm_invalid_provider_raises(
@@ -130,3 +142,108 @@ def test_create_llm_invalid_provider_raises(
 
     with pytest.raises(ValueError):
         llm_client._create_llm(model="dummy-model", temperature=0.5)
+
+
+def test_get_llm_reuses_client_for_same_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """동일한 설정으로 여러 번 호출하면 LLM 클라이언트를 재사용하고, env가 바뀌면 새로 생성하는지 검증한다."""
+
+    llm_client._get_cached_llm.cache_clear()
+
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.delenv("LLM_TIMEOUT_SECONDS", raising=False)
+
+    monkeypatch.setattr(llm_client, "ChatOpenAI", _DummyChatModel)
+
+    first = llm_client._get_llm(model="gpt-5-mini", temperature=1.0)
+    second = llm_client._get_llm(model="gpt-5-mini", temperature=1.0)
+
+    assert first is second
+
+    monkeypatch.setenv("OPENAI_API_KEY", "other-key")
+    third = llm_client._get_llm(model="gpt-5-mini", temperature=1.0)
+
+    assert third is not first
+    assert _DummyChatModel.last_init_kwargs is not None
+    assert _DummyChatModel.last_init_kwargs["api_key"] == "other-key"
+
+    llm_client._get_cached_llm.cache_clear()
+
+
+def test_generate_review_content_with_stats_streaming(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """stream=True이면 청크를 이어 붙인 텍스트와 마지막 청크의 토큰 사용량을 반환하는지 검증한다."""
+
+    llm_client._get_cached_llm.cache_clear()
+
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(llm_client, "ChatOpenAI", _DummyChatModel)
+
+    result = llm_client.generate_review_content_with_stats(
+        [{"role": "user", "content": "review"}],
+        stream=True,
+    )
+
+    assert result["content"] == "dummy-streamed"
+    assert result["input_tokens"] == 3
+    assert result["output_tokens"] == 2
+    assert result["total_tokens"] == 5
+
+    llm_client._get_cached_llm.cache_clear()
+
+
+class _NoUsageStreamChatModel(_DummyChatModel):
+    def stream(self, messages: list[Any]) -> Any:  # noqa: D401, ANN401
+        yield _DummyResponse("no-usage ")
+        yield _DummyResponse("stream")
+
+
+def test_generate_review_content_with_stats_streaming_without_usage(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """스트리밍 청크에 토큰 사용량이 없으면 토큰 필드 없이 텍스트만 반환하는지 검증한다."""
+
+    llm_client._get_cached_llm.cache_clear()
+
+    monkeypatch.setenv("LLM_PROVIDER", "openrouter")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(llm_client, "ChatOpenAI", _NoUsageStreamChatModel)
+
+    result = llm_client.generate_review_content_with_stats(
+        [{"role": "user", "content": "review"}],
+        stream=True,
+    )
+
+    assert result["content"] == "no-usage stream"
+    assert "input_tokens" not in result
+    assert "output_tokens" not in result
+    assert "total_tokens" not in result
+
+    llm_client._get_cached_llm.cache_clear()
+
+
+def test_content_to_text_handles_none_and_content_blocks() -> None:
+    assert llm_client._content_to_text(None) == ""
+    assert (
+        llm_client._content_to_text(
+            [{"type": "text", "text": "a"}, {"type": "tool_use"}, "b"],
+        )
+        == "ab"
+    )
+
+
+def test_to_langchain_messages_reuses_system_message() -> None:
+    first = llm_client._to_langchain_messages(
+        [{"role": "system", "content": "sys"}, {"role": "user", "content": "a"}]
+    )
+    second = llm_client._to_langchain_messages(
+        [{"role": "system", "content": "sys"}, {"role": "user", "content": "b"}]
+    )
+
+    assert first[0] is second[0]
+    assert first[1].content == "a"
+    assert second[1].content == "b"
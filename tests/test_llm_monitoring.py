@@ -0,0 +1,169 @@
+from typing import Any, Iterator
+
+import pytest
+
+from src import llm_monitoring
+
+
+@pytest.fixture(autouse=True)
+def _restore_monitoring_env() -> Iterator[None]:
+    """테스트에서 바꾼 env 기반 웹훅 설정을 원래대로 되돌린다."""
+
+    yield
+    llm_monitoring._refresh_env()
+
+
+class _DummyResponse:
+    status_code = 200
+
+
+class _RecordingSession:
+    """실제 웹훅 호출을 막고, 전송된 payload만 기록하기 위한 더미 세션."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def post(self, url: str, **kwargs: Any) -> _DummyResponse:  # noqa: ANN401
+        self.calls.append({"url": url, **kwargs})
+        return _DummyResponse()
+
+
+def test_send_merge_request_llm_success_posts_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """성공 이벤트가 백그라운드 전송 스레드를 통해 웹훅으로 전달되는지 검증한다."""
+
+    session = _RecordingSession()
+    monkeypatch.setattr(llm_monitoring, "_session", session)
+    monkeypatch.setenv("LLM_MONITORING_WEBHOOK_URL", "https://example.com/hook")
+    monkeypatch.setenv("LLM_MONITORING_TIMEOUT_SECONDS", "5")
+    llm_monitoring._refresh_env()
+
+    llm_monitoring.send_merge_request_llm_success(
+        gitlab_api_base_url="http://gitlab.example.com/api/v4",
+        project_id=42,
+        merge_request_iid=3,
+        llm_result={
+            "content": " review ",
+            "provider": "openai",
+            "model": "gpt-5-mini",
+            "elapsed_seconds": 1.5,
+        },
+    )
+    llm_monitoring._send_queue.join()
+
+    assert len(session.calls) == 1
+    call = session.calls[0]
+    assert call["url"] == "https://example.com/hook"
+    assert call["timeout"] == 5.0
+    assert call["json"]["status"] == "success"
+    assert call["json"]["gitlab"]["merge_request_iid"] == 3
+    assert call["json"]["review"] == {"content": "review", "length": 6}
+
+
+def test_send_push_llm_error_posts_error_payload(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _RecordingSession()
+    monkeypatch.setattr(llm_monitoring, "_session", session)
+    monkeypatch.setenv("LLM_MONITORING_WEBHOOK_URL", "https://example.com/hook")
+    llm_monitoring._refresh_env()
+
+    llm_monitoring.send_push_llm_error(
+        gitlab_api_base_url="http://gitlab.example.com/api/v4",
+        project_id=42,
+        commit_id="abc123",
+        provider="openai",
+        model="gpt-5-mini",
+        error=RuntimeError("boom"),
+    )
+    llm_monitoring._send_queue.join()
+
+    assert len(session.calls) == 1
+    payload = session.calls[0]["json"]
+    assert payload["status"] == "error"
+    assert payload["event"] == "push_review"
+    assert payload["source"] == "gitlab-ai-code-reviewer"
+    assert payload["gitlab"]["commit_id"] == "abc123"
+    assert payload["llm"] == {"provider": "openai", "model": "gpt-5-mini"}
+    assert payload["error"] == {
+        "type": "RuntimeError",
+        "message": "boom",
+        "detail": "RuntimeError('boom')",
+    }
+    assert "review" not in payload
+
+
+def test_build_error_section_truncates_large_errors() -> None:
+    section = llm_monitoring._build_error_section(RuntimeError("x" * 100_000))
+
+    assert section["type"] == "RuntimeError"
+    assert len(section["message"]) == llm_monitoring._ERROR_TEXT_MAX_LENGTH
+    assert len(section["detail"]) == llm_monitoring._ERROR_TEXT_MAX_LENGTH
+
+
+def test_send_push_llm_error_keeps_caller_traceback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _RecordingSession()
+    monkeypatch.setattr(llm_monitoring, "_session", session)
+    monkeypatch.setenv("LLM_MONITORING_WEBHOOK_URL", "https://example.com/hook")
+    llm_monitoring._refresh_env()
+
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError as caught:
+        error = caught
+
+    llm_monitoring.send_push_llm_error(
+        gitlab_api_base_url="http://gitlab.example.com/api/v4",
+        project_id=42,
+        commit_id="abc123",
+        provider="openai",
+        model="gpt-5-mini",
+        error=error,
+    )
+    llm_monitoring._send_queue.join()
+
+    assert error.__traceback__ is not None
+    assert session.calls[0]["json"]["error"]["type"] == "RuntimeError"
+
+
+def test_session_does_not_retry_read_timeouts() -> None:
+    retry = llm_monitoring._create_session().get_adapter("https://").max_retries
+
+    assert retry.read == 0
+    assert retry.total == 2
+    assert list(retry.status_forcelist) == [502, 503, 504]
+
+
+def test_invalid_timeout_falls_back_to_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("LLM_MONITORING_TIMEOUT_SECONDS", "not-a-number")
+    llm_monitoring._refresh_env()
+
+    assert llm_monitoring._timeout_seconds == llm_monitoring._DEFAULT_TIMEOUT_SECONDS
+
+
+def test_send_push_llm_error_skips_without_webhook_url(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """웹훅 URL이 설정되지 않은 경우 아무 것도 전송하지 않는지 검증한다."""
+
+    session = _RecordingSession()
+    monkeypatch.setattr(llm_monitoring, "_session", session)
+    monkeypatch.delenv("LLM_MONITORING_WEBHOOK_URL", raising=False)
+    llm_monitoring._refresh_env()
+
+    llm_monitoring.send_push_llm_error(
+        gitlab_api_base_url="http://gitlab.example.com/api/v4",
+        project_id=42,
+        commit_id="abc123",
+        provider="openai",
+        model="gpt-5-mini",
+        error=RuntimeError("boom"),
+    )
+    llm_monitoring._send_queue.join()
+
+    assert session.calls == []
@@ -0,0 +1,246 @@
+import sqlite3
+
+import pytest
+
+from src import review_cache
+from src.types import GitDiffChange, LLMReviewResult
+
+
+def _changes() -> list[GitDiffChange]:
+    return [
+        {
+            "old_path": "src/app.py",
+            "new_path": "src/app.py",
+            "new_file": False,
+            "deleted_file": False,
+            "renamed_file": False,
+            "diff": "@@ -1 +1 @@\n-print('a')\n+print('b')\n",
+        }
+    ]
+
+
+def _result() -> LLMReviewResult:
+    return {
+        "content": "looks good",
+        "provider": "openai",
+        "model": "gpt-5-mini",
+        "elapsed_seconds": 1.25,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_db(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """테스트마다 임시 DB 파일을 사용하도록 환경 변수를 설정한다."""
+
+    monkeypatch.setenv("REVIEW_CACHE_DB_PATH", str(tmp_path / "review_cache.db"))
+    review_cache._clear_memory_cache()
+    yield
+    review_cache._discard_connection()
+    review_cache._clear_memory_cache()
+
+
+def test_review_cache_returns_none_on_miss() -> None:
+    assert (
+        review_cache.get_cached_review_for_changes("openai", "gpt-5-mini", _changes())
+        is None
+    )
+
+
+def test_review_cache_round_trip() -> None:
+    """저장한 리뷰 결과를 동일한 provider/model/diff 조합으로 다시 조회할 수 있는지 검증한다."""
+
+    review_cache.put_cached_review_for_changes(
+        "openai", "gpt-5-mini", _changes(), _result()
+    )
+
+    cached = review_cache.get_cached_review_for_changes(
+        "openai", "gpt-5-mini", _changes()
+    )
+    assert cached == _result()
+
+    # provider/model이 다르면 캐시를 공유하지 않는다.
+    assert (
+        review_cache.get_cached_review_for_changes("gemini", "gpt-5-mini", _changes())
+        is None
+    )
+
+
+def test_review_cache_reuses_connection_within_thread() -> None:
+    first = review_cache._get_connection()
+    second = review_cache._get_connection()
+
+    assert first is second
+
+
+def test_review_cache_uses_wal_journal_mode() -> None:
+    conn = review_cache._get_connection()
+
+    (journal_mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+    assert journal_mode == "wal"
+
+
+def test_review_cache_drops_rows_from_older_schema_version(tmp_path) -> None:
+    """스키마 버전이 다른 기존 DB는 캐시 테이블을 비우고 현재 버전으로 올리는지 검증한다."""
+
+    path = str(tmp_path / "legacy.db")
+    legacy = sqlite3.connect(path)
+    legacy.execute(
+        """
+        CREATE TABLE review_cache (
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            diff_hash TEXT NOT NULL,
+            result_json TEXT NOT NULL,
+            PRIMARY KEY (provider, model, diff_hash)
+        )
+        """
+    )
+    legacy.execute(
+        "INSERT INTO review_cache VALUES ('openai', 'gpt-5-mini', 'old', '{}')"
+    )
+    legacy.commit()
+    legacy.close()
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    review_cache._initialize_schema(conn, path)
+
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    (count,) = conn.execute("SELECT COUNT(*) FROM review_cache").fetchone()
+    conn.close()
+
+    assert version == review_cache._SCHEMA_VERSION
+    assert count == 0
+
+
+def test_put_cached_reviews_for_changes_batch_stores_all_entries() -> None:
+    other_changes: list[GitDiffChange] = [
+        {**_changes()[0], "diff": "@@ -1 +1 @@\n-x = 1\n+x = 2\n"}
+    ]
+    other_result: LLMReviewResult = {**_result(), "content": "needs work"}
+
+    review_cache.put_cached_reviews_for_changes_batch(
+        [
+            ("openai", "gpt-5-mini", _changes(), _result()),
+            ("openai", "gpt-5-mini", other_changes, other_result),
+        ]
+    )
+
+    assert (
+        review_cache.get_cached_review_for_changes("openai", "gpt-5-mini", _changes())
+        == _result()
+    )
+    assert (
+        review_cache.get_cached_review_for_changes(
+            "openai", "gpt-5-mini", other_changes
+        )
+        == other_result
+    )
+
+
+def test_review_cache_table_is_without_rowid() -> None:
+    conn = review_cache._get_connection()
+
+    (sql,) = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'review_cache'"
+    ).fetchone()
+    assert "WITHOUT ROWID" in sql.upper()
+
+
+def test_review_cache_round_trip_without_orjson(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """orjson이 없는 환경에서도 표준 json 모듈로 저장/조회가 동작하는지 검증한다."""
+
+    monkeypatch.setattr(review_cache, "orjson", None)
+
+    review_cache.put_cached_review_for_changes(
+        "openai", "gpt-5-mini", _changes(), _result()
+    )
+
+    assert (
+        review_cache.get_cached_review_for_changes("openai", "gpt-5-mini", _changes())
+        == _result()
+    )
+
+
+def test_review_cache_serves_repeated_lookups_from_memory() -> None:
+    """한 번 조회한 키는 SQLite를 다시 조회하지 않고, 저장 시 메모리 캐시도 갱신되는지 검증한다."""
+
+    assert (
+        review_cache.get_cached_review_for_changes("openai", "gpt-5-mini", _changes())
+        is None
+    )
+
+    review_cache.put_cached_review_for_changes(
+        "openai", "gpt-5-mini", _changes(), _result()
+    )
+
+    # DB를 직접 비워도 방금 저장한 결과는 메모리에서 반환된다.
+    review_cache._get_connection().execute("DELETE FROM review_cache")
+
+    assert (
+        review_cache.get_cached_review_for_changes("openai", "gpt-5-mini", _changes())
+        == _result()
+    )
+
+
+def test_review_cache_memory_entries_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert (
+        review_cache.get_cached_review_for_changes("openai", "gpt-5-mini", _changes())
+        is None
+    )
+
+    # 다른 프로세스가 같은 키를 저장한 상황을 흉내 낸다.
+    review_cache._get_connection().execute(
+        "INSERT INTO review_cache VALUES (?, ?, ?, ?)",
+        (
+            "openai",
+            "gpt-5-mini",
+            review_cache._build_diff_hash(_changes()),
+            review_cache._dumps(_result()),
+        ),
+    )
+
+    now = review_cache._monotonic()
+    monkeypatch.setattr(
+        review_cache,
+        "_monotonic",
+        lambda: now + review_cache._MEMORY_CACHE_MISS_TTL_SECONDS + 1,
+    )
+
+    assert (
+        review_cache.get_cached_review_for_changes("openai", "gpt-5-mini", _changes())
+        == _result()
+    )
+
+
+def test_review_cache_reuses_cursor_within_thread() -> None:
+    assert review_cache._get_cursor() is review_cache._get_cursor()
+
+
+def test_review_cache_stale_miss_does_not_replace_stored_result() -> None:
+    """SQLite miss를 읽은 뒤 다른 스레드가 결과를 저장한 경우, 늦게 도착한 miss가 결과를 덮어쓰지 않는지 검증한다."""
+
+    key = ("openai", "gpt-5-mini", review_cache._build_diff_hash(_changes()))
+
+    review_cache._memory_cache_put(key, _result())
+    review_cache._memory_cache_put(key, None)
+
+    assert review_cache._memory_cache_get(key) == (True, _result())
+
+
+def test_review_cache_returns_copies_of_cached_results() -> None:
+    review_cache.put_cached_review_for_changes(
+        "openai", "gpt-5-mini", _changes(), _result()
+    )
+
+    first = review_cache.get_cached_review_for_changes(
+        "openai", "gpt-5-mini", _changes()
+    )
+    assert first is not None
+    first["content"] = "mutated"
+
+    assert (
+        review_cache.get_cached_review_for_changes("openai", "gpt-5-mini", _changes())
+        == _result()
+    )
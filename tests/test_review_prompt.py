@@ -3,7 +3,7 @@ import os
 import pytest
 
 from src.gitlab_client import get_merge_request_changes
-from src.review_prompt import generate_review_prompt
+from src.review_prompt import DEFAULT_SYSTEM_INSTRUCTION, generate_review_prompt
 
 
 def _require_env(name: str) -> str:
@@ -14,6 +14,33 @@ def _require_env(name: str) -> str:
     return value
 
 
+def test_generate_review_prompt_formats_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """파일 상태별 헤더와 diff 코드 블록이 기대한 형식으로 user 메시지에 포함되는지 검증한다."""
+
+    monkeypatch.delenv("REVIEW_SYSTEM_PROMPT", raising=False)
+
+    messages = generate_review_prompt(
+        [
+            {"old_path": "a.py", "new_path": "a.py", "diff": "-x\n+y\n"},
+            {"old_path": "b.py", "new_path": "b.py", "new_file": True, "diff": "+b"},
+            {"old_path": "c.py", "new_path": "c.py", "deleted_file": True},
+            {"old_path": "d.py", "new_path": "e.py", "diff": "  "},
+        ]
+    )
+
+    assert messages[0] == {"role": "system", "content": DEFAULT_SYSTEM_INSTRUCTION}
+    assert messages[1]["role"] == "user"
+    assert messages[1]["content"] == (
+        "Review the following git diffs:\n\n"
+        "📝 **MODIFIED**: `a.py`\n```diff\n-x\n+y\n\n```\n\n"
+        "🆕 **NEW FILE**: `b.py`\n```diff\n+b\n```\n\n"
+        "🗑️ **DELETED**: `c.py`\n```diff\n(No content changes or binary file)\n```\n\n"
+        "🚚 **RENAMED**: `d.py` ➡️ `e.py`\n```diff\n(No content changes or binary file)\n```"
+    )
+
+
 @pytest.mark.integration
 def test_generate_review_prompt_with_real_gitlab():
     # TODO: gitlab 로직과 단위테스트를 분리해야 함